@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
-from cola_label_verification.ocr import (
-    OcrExtractionResult,
-    extract_label_info_from_application_images,
-    extract_label_info_with_spans,
-)
+
+if TYPE_CHECKING:
+    from cola_label_verification.ocr import (
+        OcrExtractionResult,
+        extract_label_info_from_application_images,
+        extract_label_info_with_spans,
+    )
 
 __all__ = [
     "FieldExtraction",
@@ -12,3 +16,21 @@ __all__ = [
     "extract_label_info_from_application_images",
     "extract_label_info_with_spans",
 ]
+
+_OCR_EXPORTS = frozenset(
+    {
+        "OcrExtractionResult",
+        "extract_label_info_from_application_images",
+        "extract_label_info_with_spans",
+    }
+)
+
+
+def __getattr__(name: str) -> object:
+    # The OCR stack pulls in paddle, torch and transformers; importing the
+    # models or rules should not pay for that until OCR is actually used.
+    if name in _OCR_EXPORTS:
+        from cola_label_verification import ocr
+
+        return getattr(ocr, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,7 @@ from typing import Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldCandidate:
     """Field candidate extracted from a backend."""
 
@@ -16,7 +16,7 @@ class FieldCandidate:
     unit: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QwenFieldValue:
     """Structured field payload returned by Qwen."""
 
@@ -25,7 +25,7 @@ class QwenFieldValue:
     unit: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QwenExtractionResult:
     """Normalized Qwen response payload."""
 
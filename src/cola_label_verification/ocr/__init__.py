@@ -4,7 +4,6 @@ from dataclasses import dataclass
 
 from PIL import Image
 
-from cola_label_verification.ocr.clients import _get_default_ocr_client
 from cola_label_verification.ocr.lines import _extract_text_lines_and_spans
 from cola_label_verification.ocr.types import DEFAULT_OCR_OPTIONS, OcrSpan
 from cola_label_verification.models import (
@@ -20,7 +19,6 @@ from cola_label_verification.rules.beverage_type_presence import (
     beverage_type_from_qwen,
 )
 from cola_label_verification.rules.warning_text_helpers import attach_warning_header
-from cola_label_verification.vlm import extract_qwen_field_values
 
 _LABEL_FIELDS = tuple(
     name
@@ -317,6 +315,10 @@ def extract_label_info_with_spans(
     Returns:
         Structured label fields plus the OCR spans used for verification.
     """
+    # Paddle and the Qwen stack are heavy imports; load them on first extraction.
+    from cola_label_verification.ocr.clients import _get_default_ocr_client
+    from cola_label_verification.vlm import extract_qwen_field_values
+
     assert images, "No images provided for OCR extraction."
 
     resolved_client = ocr_client or _get_default_ocr_client()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OcrLine:
     """OCR line with optional confidence."""
 
@@ -9,7 +9,7 @@ class OcrLine:
     confidence: float | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OcrSpan:
     """OCR text span with bounding box metadata."""
 
@@ -19,7 +19,7 @@ class OcrSpan:
     image_index: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OcrOptions:
     """Runtime options passed to the OCR backend."""
 
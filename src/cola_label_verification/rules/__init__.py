@@ -5,6 +5,7 @@ from cola_label_verification.rules.models import (
     Finding,
     RuleContext,
     RulesConfig,
+    SourceOfProduct,
 )
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "Finding",
     "RuleContext",
     "RulesConfig",
+    "SourceOfProduct",
     "evaluate_checklist",
 ]
@@ -1,12 +1,14 @@
 from collections.abc import Sequence
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from cola_label_verification import taxonomy
-from cola_label_verification.ocr.types import OcrSpan
 from cola_label_verification.models import BeverageTypeClassification
 from cola_label_verification.rules.common import build_finding
 from cola_label_verification.rules.models import Finding, RuleContext
 
+if TYPE_CHECKING:
+    from cola_label_verification.ocr.types import OcrSpan
+
 _WINE_KEYWORDS: Final = (
     "WINE",
     "RED WINE",
@@ -137,7 +139,7 @@ def beverage_type_from_qwen(
 
 
 def _predict_from_spans(
-    spans: Sequence[OcrSpan] | None,
+    spans: Sequence["OcrSpan"] | None,
 ) -> BeverageTypeClassification | None:
     if not spans:
         return None
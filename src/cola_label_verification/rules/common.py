@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal
 
 from cola_label_verification.rules.models import (
@@ -6,6 +7,7 @@ from cola_label_verification.rules.models import (
     FindingSeverity,
     FindingStatus,
     RuleContext,
+    SourceOfProduct,
 )
 
 BeverageType = Literal["distilled_spirits", "wine"]
@@ -27,6 +29,8 @@ def build_finding(
     field: str | None = None,
     evidence: dict[str, object] | None = None,
 ) -> Finding:
+    if evidence is None:
+        return _static_finding(rule_id, status, message, severity, field)
     return Finding(
         rule_id=rule_id,
         status=status,
@@ -37,6 +41,24 @@ def build_finding(
     )
 
 
+@lru_cache(maxsize=256)
+def _static_finding(
+    rule_id: str,
+    status: FindingStatus,
+    message: str,
+    severity: FindingSeverity,
+    field: str | None,
+) -> Finding:
+    """Share evidence-free findings; they are frozen and fully determined by args."""
+    return Finding(
+        rule_id=rule_id,
+        status=status,
+        message=message,
+        severity=severity,
+        field=field,
+    )
+
+
 def require_beverage_type(
     context: RuleContext,
     *,
@@ -102,12 +124,40 @@ def presence_rule(
     )
 
 
+def gated_presence_rule(
+    context: RuleContext,
+    value: str | None,
+    *,
+    allowed: set[BeverageType],
+    rule_id: str,
+    field: str,
+    present_message: str,
+    missing_message: str,
+) -> Finding:
+    """Gate on beverage type, then check an optional (formulation-dependent) value."""
+    gate = require_beverage_type(
+        context,
+        allowed=allowed,
+        rule_id=rule_id,
+        field=field,
+    )
+    if gate is not None:
+        return gate
+    return presence_rule(
+        value,
+        rule_id=rule_id,
+        field=field,
+        present_message=present_message,
+        missing_message=missing_message,
+        required=None,
+    )
+
+
 def is_imported(application_fields: ApplicationFields | None) -> bool | None:
-    if application_fields is None or not application_fields.source_of_product:
+    if application_fields is None or application_fields.source_mask is None:
         return None
-    normalized = {item.strip().lower() for item in application_fields.source_of_product}
-    if "imported" in normalized:
+    if application_fields.source_mask & SourceOfProduct.IMPORTED:
         return True
-    if "domestic" in normalized:
+    if application_fields.source_mask & SourceOfProduct.DOMESTIC:
         return False
     return None
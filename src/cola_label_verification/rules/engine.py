@@ -122,5 +122,5 @@ def evaluate_checklist(
         spans=spans,
         images=images,
     )
-    findings = [rule(context) for rule in ALL_RULES]
+    findings = tuple(rule(context) for rule in ALL_RULES)
     return ChecklistResult(findings=findings)
@@ -11,7 +11,9 @@ def _field_of_vision_metadata(
     image_sizes: Sequence[tuple[int, int]],
 ) -> dict[str, object] | None:
     required = ("brand_name", "class_type", "alcohol_content")
-    spans: list[tuple[float, float, float, float, int]] = []
+    image_indices: set[int] = set()
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
     for field in required:
         candidate = candidates.get(field)
         if candidate is None or not candidate.normalized:
@@ -22,17 +24,12 @@ def _field_of_vision_metadata(
             return {"status": "unknown", "reason": "missing_bbox"}
         if not isinstance(image_index, int) or image_index < 0:
             return {"status": "unknown", "reason": "missing_image_index"}
-        spans.append(
-            (
-                float(bbox[0]),
-                float(bbox[1]),
-                float(bbox[2]),
-                float(bbox[3]),
-                image_index,
-            )
-        )
+        image_indices.add(image_index)
+        min_x = min(min_x, float(bbox[0]))
+        min_y = min(min_y, float(bbox[1]))
+        max_x = max(max_x, float(bbox[2]))
+        max_y = max(max_y, float(bbox[3]))
 
-    image_indices = {item[4] for item in spans}
     if len(image_indices) != 1:
         return {"status": "needs_review", "reason": "multiple_images"}
     image_index = next(iter(image_indices))
@@ -41,10 +38,6 @@ def _field_of_vision_metadata(
     image_width, _ = image_sizes[image_index]
     if image_width <= 0:
         return {"status": "unknown", "reason": "invalid_image_size"}
-    min_x = min(item[0] for item in spans)
-    min_y = min(item[1] for item in spans)
-    max_x = max(item[2] for item in spans)
-    max_y = max(item[3] for item in spans)
     span_ratio = (max_x - min_x) / image_width
     status = "pass" if span_ratio <= 0.4 else "needs_review"
     return {
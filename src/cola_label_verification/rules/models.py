@@ -1,5 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from enum import IntFlag
+from functools import cached_property
 from typing import TYPE_CHECKING, Literal
 
 from cola_label_verification.models import LabelInfo
@@ -20,6 +22,13 @@ FindingStatus = Literal[
 FindingSeverity = Literal["info", "warning", "error"]
 
 
+class SourceOfProduct(IntFlag):
+    """Source of product selections from the application form."""
+
+    DOMESTIC = 1
+    IMPORTED = 2
+
+
 @dataclass(frozen=True)
 class ApplicationFields:
     """Optional application fields used for context-specific checks."""
@@ -35,6 +44,18 @@ class ApplicationFields:
     appellation_of_origin: str | None = None
     source_of_product: tuple[str, ...] | None = None
 
+    @cached_property
+    def source_mask(self) -> SourceOfProduct | None:
+        """Source of product selections as flags, parsed on first access."""
+        if not self.source_of_product:
+            return None
+        mask = SourceOfProduct(0)
+        for item in self.source_of_product:
+            member = SourceOfProduct.__members__.get(item.strip().upper())
+            if member is not None:
+                mask |= member
+        return mask
+
 
 @dataclass(frozen=True)
 class RulesConfig:
@@ -70,4 +91,9 @@ class Finding:
 class ChecklistResult:
     """Checklist evaluation output."""
 
-    findings: list[Finding]
+    findings: tuple[Finding, ...] = ()
+
+    @cached_property
+    def findings_by_id(self) -> Mapping[str, Finding]:
+        """Findings keyed by rule id, built on first access."""
+        return {finding.rule_id: finding for finding in self.findings}
@@ -1,20 +1,24 @@
-from collections.abc import Iterable, Sequence
+import unicodedata
+from collections.abc import Sequence
 from dataclasses import dataclass
 from statistics import median
-from typing import Final, cast
+from typing import TYPE_CHECKING, Final
 
-from PIL import Image, ImageFilter, ImageOps
+from PIL import Image, ImageChops, ImageFilter, ImageOps
 
-from cola_label_verification.ocr.types import OcrSpan
 from cola_label_verification.rules.common import build_finding
 from cola_label_verification.rules.models import Finding, RuleContext
 
+if TYPE_CHECKING:
+    from cola_label_verification.ocr.types import OcrSpan
+
 CANONICAL_WARNING_TEXT: Final[str] = (
     "GOVERNMENT WARNING: (1) According to the Surgeon General, women "
     "should not drink alcoholic beverages during pregnancy because of the risk of "
     "birth defects. (2) Consumption of alcoholic beverages impairs your ability to "
     "drive a car or operate machinery, and may cause health problems."
 )
+_CANONICAL_WARNING_TEXT_UPPER: Final[str] = CANONICAL_WARNING_TEXT.upper()
 
 
 @dataclass(frozen=True)
@@ -37,11 +41,14 @@ def warning_text(context: RuleContext) -> Finding:
             field="warning_text",
         )
 
+    # Fold compatibility forms (ligatures, full-width and combining variants)
+    # once so every comparison below sees the same text.
+    value = unicodedata.normalize("NFKC", value)
     normalized_text = _normalize_warning_text(value)
     header_present = "GOVERNMENT WARNING" in value.upper()
     exact_match = _matches_canonical_warning(
-        value
-    ) or _matches_canonical_warning_all_caps(value)
+        normalized_text
+    ) or _matches_canonical_warning_all_caps(normalized_text)
 
     normalized_fields = label_info.warning_text.normalized or {}
     boldness = normalized_fields.get("warning_boldness")
@@ -106,17 +113,16 @@ def _normalize_warning_text(text: str) -> str:
     return " ".join(text.split())
 
 
-def _matches_canonical_warning(text: str) -> bool:
+def _matches_canonical_warning(normalized_text: str) -> bool:
     """Return True when the warning text matches the canonical statement."""
-    return _normalize_warning_text(text) == CANONICAL_WARNING_TEXT
+    return normalized_text == CANONICAL_WARNING_TEXT
 
 
-def _matches_canonical_warning_all_caps(text: str) -> bool:
+def _matches_canonical_warning_all_caps(normalized_text: str) -> bool:
     """Return True when the warning text matches the canonical statement in all caps."""
-    normalized = _normalize_warning_text(text)
-    if not normalized.isupper():
+    if not normalized_text.isupper():
         return False
-    return normalized == CANONICAL_WARNING_TEXT.upper()
+    return normalized_text == _CANONICAL_WARNING_TEXT_UPPER
 
 
 def _exactness_issue(normalized_text: str, exact_match: bool) -> str | None:
@@ -180,7 +186,7 @@ def _warning_header_bbox(
 def estimate_boldness(
     image: Image.Image,
     header_bbox: tuple[float, float, float, float],
-    peer_spans: Sequence[OcrSpan],
+    peer_spans: Sequence["OcrSpan"],
 ) -> dict[str, object] | None:
     header_metrics = _measure_metrics(_crop_with_padding(image, header_bbox))
     if header_metrics is None:
@@ -241,35 +247,29 @@ def _measure_metrics(image: Image.Image) -> BoldnessMetrics | None:
         return None
     gray = ImageOps.grayscale(image)
     gray = ImageOps.autocontrast(gray)
-    contrast = _contrast_ratio(gray)
+    hist = gray.histogram()
+    contrast = _contrast_ratio(hist)
     if contrast < 0.05:
         return None
-    threshold = _otsu_threshold(gray)
-    pixels = _pixel_values(gray)
-    total = len(pixels)
-    if total == 0:
-        return None
-    below_mask = [value <= threshold for value in pixels]
-    below = sum(1 for is_foreground in below_mask if is_foreground)
+    threshold = _otsu_threshold(hist)
+    total = gray.width * gray.height
+    below = sum(hist[: threshold + 1])
     above = total - below
     if below == 0 or above == 0:
         return None
     if below <= above:
-        foreground_mask = below_mask
+        foreground = gray.point(_threshold_lut(threshold, below=True))
         foreground_pixels = below
     else:
-        foreground_mask = [not value for value in below_mask]
+        foreground = gray.point(_threshold_lut(threshold, below=False))
         foreground_pixels = above
     foreground_ratio = foreground_pixels / total
     edges = gray.filter(ImageFilter.FIND_EDGES)
-    edge_pixels = _pixel_values(edges)
-    edge_mean = sum(edge_pixels) / total
+    edge_hist = edges.histogram()
+    edge_mean = sum(index * count for index, count in enumerate(edge_hist)) / total
     edge_threshold = max(10.0, edge_mean * 1.5)
-    edge_in_foreground = sum(
-        1
-        for edge_value, is_foreground in zip(edge_pixels, foreground_mask, strict=False)
-        if is_foreground and edge_value > edge_threshold
-    )
+    strong_edges = edges.point(_threshold_lut(edge_threshold, below=False))
+    edge_in_foreground = ImageChops.darker(foreground, strong_edges).histogram()[255]
     edge_ratio = edge_in_foreground / total
     stroke_ratio = (
         foreground_pixels / edge_in_foreground if edge_in_foreground > 0 else 0.0
@@ -282,17 +282,33 @@ def _measure_metrics(image: Image.Image) -> BoldnessMetrics | None:
     )
 
 
-def _contrast_ratio(image: Image.Image) -> float:
-    pixels = sorted(_pixel_values(image))
-    if not pixels:
+def _threshold_lut(threshold: float, *, below: bool) -> list[int]:
+    """Build an 8-bit lookup table marking pixels on one side of a threshold."""
+    if below:
+        return [255 if value <= threshold else 0 for value in range(256)]
+    return [255 if value > threshold else 0 for value in range(256)]
+
+
+def _contrast_ratio(hist: Sequence[int]) -> float:
+    total = sum(hist)
+    if total == 0:
         return 0.0
-    p5 = pixels[int(len(pixels) * 0.05)]
-    p95 = pixels[int(len(pixels) * 0.95)]
+    p5 = _histogram_rank_value(hist, int(total * 0.05))
+    p95 = _histogram_rank_value(hist, int(total * 0.95))
     return (p95 - p5) / 255.0
 
 
-def _otsu_threshold(image: Image.Image) -> int:
-    hist = image.histogram()
+def _histogram_rank_value(hist: Sequence[int], rank: int) -> int:
+    """Return the pixel value at ``rank`` in sorted order, read from a histogram."""
+    cumulative = 0
+    for value, count in enumerate(hist):
+        cumulative += count
+        if cumulative > rank:
+            return value
+    return len(hist) - 1
+
+
+def _otsu_threshold(hist: Sequence[int]) -> int:
     total = sum(hist)
     sum_total = sum(index * count for index, count in enumerate(hist))
     sum_background = 0
@@ -320,10 +336,6 @@ def _otsu_threshold(image: Image.Image) -> int:
     return threshold
 
 
-def _pixel_values(image: Image.Image) -> list[int]:
-    return list(cast(Iterable[int], image.getdata()))
-
-
 def _metrics_payload(metrics: BoldnessMetrics) -> dict[str, float]:
     return {
         "foreground_ratio": round(metrics.foreground_ratio, 4),
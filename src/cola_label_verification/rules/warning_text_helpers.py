@@ -1,10 +1,14 @@
 import logging
+import re
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from cola_label_verification.models import FieldCandidate
-from cola_label_verification.ocr.types import OcrSpan
 from cola_label_verification.text import normalize_for_match
 
+if TYPE_CHECKING:
+    from cola_label_verification.ocr.types import OcrSpan
+
 logger = logging.getLogger(__name__)
 
 WARNING_HEADER_TOKENS = ("GOVERNMENT", "WARNING")
@@ -19,20 +23,26 @@ WARNING_BODY_TOKENS = (
     "MACHINERY",
     "HEALTH",
 )
+_WARNING_TEXT_RE = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in (*WARNING_HEADER_TOKENS, *WARNING_BODY_TOKENS, "(1)", "(2)")
+    )
+)
+# Glyphs OCR commonly reads in place of letters (e.g. "G0VERNMENT WARNlNG").
+_OCR_CONFUSABLES = str.maketrans({"0": "O", "1": "I", "l": "I", "|": "I"})
 
 
 def looks_like_warning_text(text: str) -> bool:
-    upper = text.upper()
-    if any(token in upper for token in WARNING_HEADER_TOKENS):
+    if _WARNING_TEXT_RE.search(text.upper()):
         return True
-    if any(token in upper for token in WARNING_BODY_TOKENS):
-        return True
-    return "(1)" in upper or "(2)" in upper
+    folded = text.translate(_OCR_CONFUSABLES).upper()
+    return _WARNING_TEXT_RE.search(folded) is not None
 
 
 def attach_warning_header(
     candidate: FieldCandidate | None,
-    spans: Sequence[OcrSpan],
+    spans: Sequence["OcrSpan"],
 ) -> FieldCandidate | None:
     if candidate is None:
         return None
@@ -82,40 +92,43 @@ def attach_warning_header(
 
 
 def _find_warning_header_bbox(
-    spans: Sequence[OcrSpan],
+    spans: Sequence["OcrSpan"],
 ) -> tuple[tuple[float, float, float, float], int] | None:
-    matches: list[OcrSpan] = []
+    first_match: OcrSpan | None = None
+    gov_spans: list[OcrSpan] = []
+    warn_by_image: dict[int, list[OcrSpan]] = {}
     for span in spans:
         upper = span.text.upper()
-        if "GOVERNMENT" in upper or "WARNING" in upper:
-            matches.append(span)
-        if "GOVERNMENT" in upper and "WARNING" in upper:
+        has_government = "GOVERNMENT" in upper
+        has_warning = "WARNING" in upper
+        if has_government and has_warning:
             return span.bbox, span.image_index
-    if not matches:
+        if has_government:
+            gov_spans.append(span)
+        elif has_warning:
+            warn_by_image.setdefault(span.image_index, []).append(span)
+        else:
+            continue
+        if first_match is None:
+            first_match = span
+    if first_match is None:
         return None
-    gov_spans = [span for span in matches if "GOVERNMENT" in span.text.upper()]
-    warn_spans = [span for span in matches if "WARNING" in span.text.upper()]
     best_score = float("inf")
-    best_bbox: tuple[float, float, float, float] | None = None
-    best_index: int | None = None
+    best_pair: tuple[OcrSpan, OcrSpan] | None = None
     for gov in gov_spans:
-        for warn in warn_spans:
-            if gov.image_index != warn.image_index:
-                continue
+        for warn in warn_by_image.get(gov.image_index, ()):
             score = _pair_span_score(gov, warn)
             if score < best_score:
                 best_score = score
-                best_bbox = _union_bbox(gov.bbox, warn.bbox)
-                best_index = gov.image_index
-    if best_bbox is not None and best_index is not None:
-        return best_bbox, best_index
-    for span in matches:
-        return span.bbox, span.image_index
-    return None
+                best_pair = (gov, warn)
+    if best_pair is not None:
+        gov, warn = best_pair
+        return _union_bbox(gov.bbox, warn.bbox), gov.image_index
+    return first_match.bbox, first_match.image_index
 
 
 def _find_warning_header_from_text(
-    spans: Sequence[OcrSpan],
+    spans: Sequence["OcrSpan"],
     warning_text: str,
 ) -> tuple[tuple[float, float, float, float], int] | None:
     target = normalize_for_match(warning_text)
@@ -156,7 +169,7 @@ def _find_warning_header_from_text(
     return bbox, image_index
 
 
-def _pair_span_score(span_a: OcrSpan, span_b: OcrSpan) -> float:
+def _pair_span_score(span_a: "OcrSpan", span_b: "OcrSpan") -> float:
     center_a = (
         (span_a.bbox[0] + span_a.bbox[2]) / 2,
         (span_a.bbox[1] + span_a.bbox[3]) / 2,
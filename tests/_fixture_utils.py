@@ -0,0 +1,62 @@
+import json
+import os
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import ExitStack, contextmanager
+from functools import cache
+from pathlib import Path
+
+from PIL import Image
+
+FIXTURE_ROOTS = (Path("tests/fixtures/samples"),)
+
+# Records a non-fatal fixture problem; provided by the report_fixture_issue fixture.
+FixtureIssueReporter = Callable[[Path, str], None]
+
+
+@cache
+def _read_fixture_json(fixture_dir: Path) -> bytes:
+    return (fixture_dir / "data.json").read_bytes()
+
+
+def load_fixture_data(fixture_dir: Path) -> dict[str, object]:
+    """Parse a fixture's data.json into a fresh dict; the file is read once."""
+    return json.loads(_read_fixture_json(fixture_dir))
+
+
+@contextmanager
+def open_fixture_images(
+    fixture_dir: Path,
+    data: Mapping[str, object],
+    report_issue: FixtureIssueReporter,
+) -> Iterator[list[Image.Image]]:
+    """Open a fixture's label images and close all of them when the block exits."""
+    with ExitStack() as stack:
+        images: list[Image.Image] = []
+        for name in data.get("images", []):
+            try:
+                image = Image.open(fixture_dir / "images" / name)
+            except FileNotFoundError:
+                report_issue(fixture_dir, f"missing image file {name}")
+                continue
+            images.append(stack.enter_context(image))
+        yield images
+
+
+def _iter_fixture_dirs() -> list[Path]:
+    fixture_dirs: list[Path] = []
+    for root in FIXTURE_ROOTS:
+        if not root.exists():
+            continue
+        with os.scandir(root) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.is_dir() and os.path.exists(
+                    os.path.join(entry.path, "data.json")
+                ):
+                    fixture_dirs.append(Path(entry.path))
+    return fixture_dirs
+
+
+FIXTURE_DIRS = _iter_fixture_dirs()
+FIXTURE_IDS = [
+    f"{fixture_dir.parent.name}/{fixture_dir.name}" for fixture_dir in FIXTURE_DIRS
+]
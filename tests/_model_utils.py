@@ -0,0 +1,16 @@
+from functools import cache
+from typing import Literal
+
+from cola_label_verification.models import BeverageTypeClassification
+
+
+@cache
+def beverage_type_classification(
+    beverage_type: Literal["distilled_spirits", "wine"],
+) -> BeverageTypeClassification:
+    """Shared classification for rule tests; it carries no mutable evidence."""
+    return BeverageTypeClassification(
+        beverage_type=beverage_type,
+        confidence=0.9,
+        evidence=None,
+    )
@@ -1,46 +1,93 @@
-import json
-import warnings
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 import pytest
-from PIL import Image
 
 from cola_label_verification.models import LabelInfo
-from cola_label_verification.ocr import extract_label_info_from_application_images
+from cola_label_verification.ocr import (
+    OcrExtractionResult,
+    extract_label_info_with_spans,
+)
+from tests._fixture_utils import (
+    FixtureIssueReporter,
+    load_fixture_data,
+    open_fixture_images,
+)
 
 CRYSTAL_SPRINGS_DIR = Path("tests/fixtures/samples/18295001000454")
+# (fixture id, message) pairs; a set so repeated reports collapse to one line.
+FIXTURE_ISSUES_KEY = pytest.StashKey[set[tuple[str, str]]]()
 
 
-def _load_fixture_data(fixture_dir: Path) -> dict[str, object]:
-    return json.loads((fixture_dir / "data.json").read_text(encoding="utf-8"))
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[FIXTURE_ISSUES_KEY] = set()
 
 
-def _open_images(fixture_dir: Path, data: dict[str, object]) -> list[Image.Image]:
-    images: list[Image.Image] = []
-    for name in data.get("images", []):
-        image_path = fixture_dir / "images" / name
-        if not image_path.exists():
-            warnings.warn(f"Missing image file: {image_path}", stacklevel=2)
-            continue
-        images.append(Image.open(image_path))
-    return images
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter,
+    config: pytest.Config,
+) -> None:
+    issues = config.stash[FIXTURE_ISSUES_KEY]
+    if not issues:
+        return
+    terminalreporter.section("fixture issues")
+    for fixture_id, message in sorted(issues):
+        terminalreporter.write_line(f"{fixture_id}: {message}")
 
 
-def _close_images(images: list[Image.Image]) -> None:
-    for image in images:
-        image.close()
+@pytest.fixture(scope="session")
+def report_fixture_issue(pytestconfig: pytest.Config) -> FixtureIssueReporter:
+    """Record a non-fatal fixture problem for the end-of-session summary."""
+    issues = pytestconfig.stash[FIXTURE_ISSUES_KEY]
+
+    def _report(fixture_dir: Path, message: str) -> None:
+        issues.add((fixture_dir.name, message))
+
+    return _report
+
+
+@pytest.fixture(scope="session")
+def cached_extraction(
+    report_fixture_issue: FixtureIssueReporter,
+) -> Callable[[Path], OcrExtractionResult]:
+    """Run OCR extraction at most once per fixture directory in this process.
+
+    Fixtures without readable images are remembered by their skip reason, so later
+    tests skip without reopening them. Under pytest-xdist each worker keeps its own
+    cache and runs its own extractions.
+    """
+    # A str value is the skip reason for a fixture that could not be extracted.
+    extractions: dict[Path, OcrExtractionResult | str] = {}
+
+    def _extract(fixture_dir: Path) -> OcrExtractionResult:
+        extraction = extractions.get(fixture_dir)
+        if extraction is None:
+            data = load_fixture_data(fixture_dir)
+            with open_fixture_images(fixture_dir, data, report_fixture_issue) as images:
+                if images:
+                    extraction = extract_label_info_with_spans(images)
+                else:
+                    report_fixture_issue(fixture_dir, "no readable images")
+                    extraction = f"Fixture {fixture_dir.name} has no readable images."
+            extractions[fixture_dir] = extraction
+        if isinstance(extraction, str):
+            pytest.skip(extraction)
+        return extraction
+
+    return _extract
+
+
+@pytest.fixture(scope="session")
+def crystal_springs_data() -> Mapping[str, object]:
+    if not CRYSTAL_SPRINGS_DIR.exists():
+        pytest.skip(f"Fixture directory missing: {CRYSTAL_SPRINGS_DIR}")
+    return load_fixture_data(CRYSTAL_SPRINGS_DIR)
 
 
 @pytest.fixture(scope="session")
-def crystal_springs_extraction() -> LabelInfo:
-    fixture_dir = CRYSTAL_SPRINGS_DIR
-    if not fixture_dir.exists():
-        pytest.skip(f"Fixture directory missing: {fixture_dir}")
-    data = _load_fixture_data(fixture_dir)
-    images = _open_images(fixture_dir, data)
-    if not images:
-        pytest.skip(f"Fixture {fixture_dir.name} has no readable images.")
-    try:
-        return extract_label_info_from_application_images(images)
-    finally:
-        _close_images(images)
+def crystal_springs_extraction(
+    cached_extraction: Callable[[Path], OcrExtractionResult],
+) -> LabelInfo:
+    if not CRYSTAL_SPRINGS_DIR.exists():
+        pytest.skip(f"Fixture directory missing: {CRYSTAL_SPRINGS_DIR}")
+    return cached_extraction(CRYSTAL_SPRINGS_DIR).label_info
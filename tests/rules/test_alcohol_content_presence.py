@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.alcohol_content_presence import (
     alcohol_content_presence,
@@ -5,6 +7,7 @@ from cola_label_verification.rules.alcohol_content_presence import (
 from cola_label_verification.rules.models import RuleContext
 
 
+@lru_cache(maxsize=None)
 def _context_with_alcohol_content(
     value: str | None,
     numeric_value: float | None,
@@ -1,14 +1,17 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
 from cola_label_verification.rules.appellation_presence import appellation_presence
 from cola_label_verification.rules.models import RuleContext
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_appellation(
     value: str | None,
     *,
@@ -16,11 +19,7 @@ def _context_with_appellation(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         appellation_of_origin=FieldExtraction(value=value),
         beverage_type=classification,
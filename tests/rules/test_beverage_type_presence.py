@@ -1,11 +1,15 @@
-from cola_label_verification.models import BeverageTypeClassification, LabelInfo
+from functools import lru_cache
+
+from cola_label_verification.models import LabelInfo
 from cola_label_verification.rules.beverage_type_presence import (
     beverage_type_presence,
     classify_beverage_type,
 )
 from cola_label_verification.rules.models import ApplicationFields, RuleContext
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_beverage_type(
     beverage_type: str | None,
     *,
@@ -13,11 +17,7 @@ def _context_with_beverage_type(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     application_fields = (
         ApplicationFields(beverage_type=selected) if selected is not None else None
     )
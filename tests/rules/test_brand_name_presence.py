@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import FieldExtraction, LabelInfo
@@ -5,6 +7,7 @@ from cola_label_verification.rules.brand_name_presence import brand_name_presenc
 from cola_label_verification.rules.models import RuleContext
 
 
+@lru_cache(maxsize=None)
 def _context_with_brand_name(value: str | None) -> RuleContext:
     label_info = LabelInfo(brand_name=FieldExtraction(value=value))
     return RuleContext(label_info=label_info, application_fields=None)
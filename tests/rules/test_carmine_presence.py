@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.carmine_presence import carmine_presence
 from cola_label_verification.rules.models import RuleContext
@@ -9,6 +11,7 @@ MISSING_MESSAGE = (
 )
 
 
+@lru_cache(maxsize=None)
 def _context_with_carmine(value: str | None) -> RuleContext:
     label_info = LabelInfo(carmine=FieldExtraction(value=value))
     return RuleContext(label_info=label_info, application_fields=None)
@@ -1,18 +1,21 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
 from cola_label_verification.rules.class_type_presence import class_type_presence
 from cola_label_verification.rules.models import RuleContext
+from tests._model_utils import beverage_type_classification
 
 
 def _field(value: str | None) -> FieldExtraction:
     return FieldExtraction(value=value)
 
 
+@lru_cache(maxsize=None)
 def _context_with_class_type(
     beverage_type: str | None,
     *,
@@ -22,11 +25,7 @@ def _context_with_class_type(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         class_type=_field(class_type),
@@ -1,7 +1,8 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -9,8 +10,10 @@ from cola_label_verification.rules.coloring_materials_presence import (
     coloring_materials_presence,
 )
 from cola_label_verification.rules.models import RuleContext
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_beverage_type(
     beverage_type: str | None,
     *,
@@ -18,11 +21,7 @@ def _context_with_beverage_type(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     coloring_materials = FieldExtraction(value=coloring_value)
     label_info = LabelInfo(
         beverage_type=classification,
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from cola_label_verification.models import (
     BeverageTypeClassification,
     FieldExtraction,
@@ -9,6 +11,7 @@ from cola_label_verification.rules.commodity_statement_distilled_from_presence i
 from cola_label_verification.rules.models import RuleContext
 
 
+@lru_cache(maxsize=None)
 def _context_with_distilled_from(
     value: str | None,
     *,
@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -7,19 +8,17 @@ from cola_label_verification.rules.commodity_statement_neutral_spirits_presence
     commodity_statement_neutral_spirits_presence,
 )
 from cola_label_verification.rules.models import RuleContext
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_for_rule(
     value: str | None,
     beverage_type: str | None,
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         commodity_statement_neutral_spirits=FieldExtraction(value=value),
         beverage_type=classification,
@@ -1,6 +1,6 @@
 import pytest
 
-from cola_label_verification.models import BeverageTypeClassification, LabelInfo
+from cola_label_verification.models import LabelInfo
 from cola_label_verification.rules.common import (
     build_finding,
     is_imported,
@@ -9,16 +9,13 @@ from cola_label_verification.rules.common import (
     resolve_beverage_type,
 )
 from cola_label_verification.rules.models import ApplicationFields, RuleContext
+from tests._model_utils import beverage_type_classification
 
 
 def _context_with_prediction(beverage_type: str | None) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     return RuleContext(
         label_info=LabelInfo(beverage_type=classification),
         application_fields=None,
@@ -59,6 +56,17 @@ def test_build_finding_accepts_field_and_evidence() -> None:
     assert finding.evidence == evidence
 
 
+def test_build_finding_reuses_findings_without_evidence() -> None:
+    first = build_finding("rule_id", "fail", "Missing field", field="field")
+    second = build_finding("rule_id", "fail", "Missing field", field="field")
+    assert first is second
+
+    with_evidence = build_finding("rule_id", "fail", "Missing field", evidence={})
+    assert with_evidence is not build_finding(
+        "rule_id", "fail", "Missing field", evidence={}
+    )
+
+
 def test_require_beverage_type_returns_not_evaluated_when_missing() -> None:
     finding = require_beverage_type(
         _context_with_prediction(None),
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.country_of_origin_presence import (
     country_of_origin_presence,
@@ -5,6 +7,7 @@ from cola_label_verification.rules.country_of_origin_presence import (
 from cola_label_verification.rules.models import ApplicationFields, RuleContext
 
 
+@lru_cache(maxsize=None)
 def _context(
     country_value: str | None,
     *,
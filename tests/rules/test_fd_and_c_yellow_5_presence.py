@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import FieldExtraction, LabelInfo
@@ -7,6 +9,7 @@ from cola_label_verification.rules.fd_and_c_yellow_5_presence import (
 from cola_label_verification.rules.models import RuleContext
 
 
+@lru_cache(maxsize=None)
 def _context_with_value(value: str | None) -> RuleContext:
     label_info = LabelInfo(fd_and_c_yellow_5=FieldExtraction(value=value))
     return RuleContext(label_info=label_info, application_fields=None)
@@ -10,6 +10,7 @@ from cola_label_verification.rules.field_of_vision import (
     field_of_vision_check,
 )
 from cola_label_verification.rules.models import RuleContext
+from tests._model_utils import beverage_type_classification
 
 
 def _candidate(*, bbox: list[float], image_index: int) -> FieldCandidate:
@@ -35,11 +36,7 @@ def _base_candidates(*, image_index: int = 0) -> dict[str, FieldCandidate | None
 def _beverage_type(value: str | None) -> BeverageTypeClassification | None:
     if value is None:
         return None
-    return BeverageTypeClassification(
-        beverage_type=value,
-        confidence=0.9,
-        evidence={"source": "test"},
-    )
+    return beverage_type_classification(value)
 
 
 def _context(label_info: LabelInfo) -> RuleContext:
@@ -1,7 +1,11 @@
+import copy
+import pickle
+from dataclasses import asdict
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -13,7 +17,12 @@ from cola_label_verification.rules.grape_varietals import (
     normalize_grape_name,
     split_grape_varietals,
 )
-from cola_label_verification.rules.models import ApplicationFields, RuleContext
+from cola_label_verification.rules.models import (
+    ApplicationFields,
+    ChecklistResult,
+    RuleContext,
+)
+from tests._model_utils import beverage_type_classification
 
 
 def _field(value: str | None) -> FieldExtraction:
@@ -28,11 +37,7 @@ def _label_info(
 ) -> LabelInfo:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     return LabelInfo(
         grape_varietals=_field(grape_varietals_value),
         appellation_of_origin=_field(appellation_value),
@@ -40,6 +45,7 @@ def _label_info(
     )
 
 
+@lru_cache(maxsize=None)
 def _context(
     *,
     beverage_type: str | None,
@@ -239,3 +245,36 @@ def test_grape_varietals_not_evaluated_without_source_of_product() -> None:
         "appellation_present": True,
         "approval_status": "not_evaluated",
     }
+
+
+def test_grape_varietals_imported_result_is_copyable() -> None:
+    context = _context(
+        beverage_type="wine",
+        grape_varietals_value="Mystery Grape",
+        appellation_value="Mendoza",
+        source_of_product=("imported",),
+    )
+    first = grape_varietals(context)
+
+    result = ChecklistResult(findings=(first,))
+    assert asdict(result)["findings"][0]["evidence"] == first.evidence
+    assert copy.deepcopy(result) == result
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_grape_varietals_evidence_key_order() -> None:
+    finding = grape_varietals(
+        _context(
+            beverage_type="wine",
+            grape_varietals_value="Mystery Grape",
+            appellation_value="Napa Valley",
+            source_of_product=("domestic",),
+        )
+    )
+    assert finding.evidence is not None
+    assert list(finding.evidence) == [
+        "appellation_present",
+        "imported",
+        "unknown_varietals",
+        "approval_status",
+    ]
@@ -1,4 +1,4 @@
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, asdict, fields
 
 import pytest
 
@@ -9,6 +9,7 @@ from cola_label_verification.rules.models import (
     Finding,
     RuleContext,
     RulesConfig,
+    SourceOfProduct,
 )
 
 
@@ -26,6 +27,24 @@ def test_application_fields_accepts_tuple_source() -> None:
     assert fields.source_of_product == ("Imported", "Domestic")
 
 
+def test_application_fields_derives_source_mask() -> None:
+    assert ApplicationFields().source_mask is None
+    assert ApplicationFields(source_of_product=(" Imported ",)).source_mask == (
+        SourceOfProduct.IMPORTED
+    )
+    assert ApplicationFields(source_of_product=("domestic", "Other")).source_mask == (
+        SourceOfProduct.DOMESTIC
+    )
+    assert ApplicationFields(source_of_product=("International",)).source_mask == 0
+
+
+def test_application_fields_source_mask_is_not_a_field() -> None:
+    application_fields = ApplicationFields(source_of_product=("Imported",))
+    assert application_fields.source_mask == SourceOfProduct.IMPORTED
+    assert "source_mask" not in {field.name for field in fields(ApplicationFields)}
+    assert "source_mask" not in asdict(application_fields)
+
+
 def test_application_fields_is_frozen() -> None:
     fields = ApplicationFields()
     with pytest.raises(FrozenInstanceError):
@@ -77,13 +96,35 @@ def test_finding_and_checklist_result_are_frozen() -> None:
         field="warning_text",
         evidence={"matched": True},
     )
-    result = ChecklistResult(findings=[finding])
+    result = ChecklistResult(findings=(finding,))
 
-    assert result.findings == [finding]
+    assert result.findings == (finding,)
     assert result.findings[0].evidence == {"matched": True}
 
     with pytest.raises(FrozenInstanceError):
         finding.message = "Updated"
 
     with pytest.raises(FrozenInstanceError):
-        result.findings = []
+        result.findings = ()
+
+
+def test_checklist_result_indexes_findings_by_rule_id() -> None:
+    first = Finding(
+        rule_id="brand_name_presence",
+        status="pass",
+        message="Brand name detected.",
+        severity="info",
+    )
+    second = Finding(
+        rule_id="warning_text",
+        status="fail",
+        message="Government warning statement not detected.",
+        severity="warning",
+    )
+    result = ChecklistResult(findings=(first, second))
+
+    assert result.findings_by_id == {
+        "brand_name_presence": first,
+        "warning_text": second,
+    }
+    assert result.findings_by_id is result.findings_by_id
@@ -1,13 +1,20 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.name_and_address_presence import (
     name_and_address_presence,
 )
 
+_EMPTY_LABEL_INFO = LabelInfo()
+
 
+@lru_cache(maxsize=None)
 def _context_with_name_and_address(value: str | None) -> RuleContext:
     return RuleContext(
-        label_info=LabelInfo(name_and_address=FieldExtraction(value=value)),
+        label_info=_EMPTY_LABEL_INFO.model_copy(
+            update={"name_and_address": FieldExtraction(value=value)}
+        ),
         application_fields=None,
     )
 
@@ -25,7 +32,7 @@ def test_name_and_address_presence_passes_with_value() -> None:
 
 def test_name_and_address_presence_fails_with_default_missing_value() -> None:
     finding = name_and_address_presence(
-        RuleContext(label_info=LabelInfo(), application_fields=None)
+        RuleContext(label_info=_EMPTY_LABEL_INFO, application_fields=None)
     )
     assert finding.rule_id == "name_and_address_presence"
     assert finding.status == "fail"
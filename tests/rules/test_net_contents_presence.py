@@ -1,15 +1,20 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.net_contents_presence import net_contents_presence
 
+_EMPTY_LABEL_INFO = LabelInfo()
+
 
+@lru_cache(maxsize=None)
 def _context_with_net_contents(
     *,
     value: str | None,
     numeric_value: float | None,
 ) -> RuleContext:
     extraction = FieldExtraction(value=value, numeric_value=numeric_value)
-    label_info = LabelInfo(net_contents=extraction)
+    label_info = _EMPTY_LABEL_INFO.model_copy(update={"net_contents": extraction})
     return RuleContext(label_info=label_info, application_fields=None)
 
 
@@ -1,7 +1,8 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -9,19 +10,17 @@ from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.percentage_of_foreign_wine_presence import (
     percentage_of_foreign_wine_presence,
 )
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_percentage(
     beverage_type: str | None,
     percentage_value: str | None,
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         percentage_of_foreign_wine=FieldExtraction(value=percentage_value),
@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -7,6 +8,7 @@ from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.statement_of_age_presence import (
     statement_of_age_presence,
 )
+from tests._model_utils import beverage_type_classification
 
 NOT_EVALUATED_MESSAGE = (
     "Statement of age not detected; requirement depends on product type and aging."
@@ -16,6 +18,7 @@ NOT_APPLICABLE_MESSAGE = "Rule not applicable to the selected beverage type."
 PRESENT_MESSAGE = "Statement of age detected."
 
 
+@lru_cache(maxsize=None)
 def _context(
     beverage_type: str | None,
     *,
@@ -23,11 +26,7 @@ def _context(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         statement_of_age=FieldExtraction(value=statement_of_age),
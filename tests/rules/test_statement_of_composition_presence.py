@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -7,19 +8,17 @@ from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.statement_of_composition_presence import (
     statement_of_composition_presence,
 )
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_statement(
     beverage_type: str | None,
     statement_value: str | None,
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         statement_of_composition=FieldExtraction(value=statement_value),
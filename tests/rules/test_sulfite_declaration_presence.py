@@ -1,13 +1,20 @@
+from functools import lru_cache
+
 from cola_label_verification.models import FieldExtraction, LabelInfo
 from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.sulfite_declaration_presence import (
     sulfite_declaration_presence,
 )
 
+_EMPTY_LABEL_INFO = LabelInfo()
+
 
+@lru_cache(maxsize=None)
 def _context_with_sulfite(value: str | None) -> RuleContext:
     return RuleContext(
-        label_info=LabelInfo(sulfite_declaration=FieldExtraction(value=value)),
+        label_info=_EMPTY_LABEL_INFO.model_copy(
+            update={"sulfite_declaration": FieldExtraction(value=value)}
+        ),
         application_fields=None,
     )
 
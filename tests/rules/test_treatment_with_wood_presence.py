@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -7,8 +8,10 @@ from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.treatment_with_wood_presence import (
     treatment_with_wood_presence,
 )
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_for(
     beverage_type: str | None,
     *,
@@ -16,11 +19,7 @@ def _context_for(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         treatment_with_wood=FieldExtraction(value=treatment_value),
@@ -1,4 +1,4 @@
-from PIL import Image
+from PIL import Image, ImageDraw
 
 import cola_label_verification.rules.warning_text as warning_text_module
 from cola_label_verification.models import FieldExtraction, LabelInfo
@@ -77,6 +77,18 @@ def test_warning_text_passes_with_boldness_pass() -> None:
     assert finding.evidence.get("warning_text_exact_match") is True
 
 
+def test_warning_text_matches_compatibility_forms() -> None:
+    text = CANONICAL_WARNING_TEXT.replace("WARNING:", "WARNING：").replace("(1)", "⑴")
+    normalized = {"warning_boldness": {"status": "pass"}}
+    context = _context_with_warning_text(text, normalized=normalized)
+    finding = warning_text(context)
+
+    assert finding.status == "pass"
+    assert finding.evidence is not None
+    assert finding.evidence.get("warning_text_exact_match") is True
+    assert finding.evidence.get("warning_text_normalized") == CANONICAL_WARNING_TEXT
+
+
 def test_warning_text_uppercase_mismatch_flags_wording() -> None:
     text = CANONICAL_WARNING_TEXT.upper().replace(
         "THE SURGEON GENERAL",
@@ -93,6 +105,20 @@ def test_warning_text_uppercase_mismatch_flags_wording() -> None:
     assert finding.evidence.get("warning_text_exact_match") is False
 
 
+def test_measure_metrics_counts_foreground_and_stroke_edges() -> None:
+    image = Image.new("RGB", (20, 10), "black")
+    ImageDraw.Draw(image).rectangle((5, 3, 14, 6), fill="white")
+
+    metrics = warning_text_module._measure_metrics(image)
+
+    assert metrics == BoldnessMetrics(
+        foreground_ratio=0.2,
+        edge_ratio=0.12,
+        stroke_ratio=40 / 24,
+        contrast=1.0,
+    )
+
+
 def test_estimate_boldness_fallback_without_peers(monkeypatch) -> None:
     metrics = BoldnessMetrics(
         foreground_ratio=0.05,
@@ -42,6 +42,8 @@ def _span(
     [
         ("Government Warning", True),
         ("surgeon general", True),
+        ("G0VERNMENT WARNlNG", True),
+        ("SURGE0N GENERAL", True),
         ("(1) and (2)", True),
         ("nothing to see here", False),
     ],
@@ -1,7 +1,8 @@
+from functools import lru_cache
+
 import pytest
 
 from cola_label_verification.models import (
-    BeverageTypeClassification,
     FieldExtraction,
     LabelInfo,
 )
@@ -9,8 +10,10 @@ from cola_label_verification.rules.models import RuleContext
 from cola_label_verification.rules.wine_designation_present import (
     wine_designation_present,
 )
+from tests._model_utils import beverage_type_classification
 
 
+@lru_cache(maxsize=None)
 def _context_with_fields(
     *,
     beverage_type: str | None,
@@ -20,11 +23,7 @@ def _context_with_fields(
 ) -> RuleContext:
     classification = None
     if beverage_type is not None:
-        classification = BeverageTypeClassification(
-            beverage_type=beverage_type,
-            confidence=0.9,
-            evidence={"source": "test"},
-        )
+        classification = beverage_type_classification(beverage_type)
     label_info = LabelInfo(
         beverage_type=classification,
         class_type=FieldExtraction(value=class_type),
@@ -3,10 +3,10 @@ from cola_label_verification.rules import evaluate_checklist
 
 
 def _find_finding(result, rule_id: str):
-    for finding in result.findings:
-        if finding.rule_id == rule_id:
-            return finding
-    raise AssertionError(f"{rule_id} finding not found")
+    finding = result.findings_by_id.get(rule_id)
+    if finding is None:
+        raise AssertionError(f"{rule_id} finding not found")
+    return finding
 
 
 def test_alcohol_content_extraction(
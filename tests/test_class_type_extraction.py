@@ -1,24 +1,23 @@
-import json
 import re
-import warnings
-from functools import lru_cache
+from collections.abc import Callable, Mapping
+from functools import cache
 from pathlib import Path
 
 import pytest
-from PIL import Image
 
-from cola_label_verification.ocr import extract_label_info_from_application_images
+from cola_label_verification.ocr import OcrExtractionResult
+from tests._fixture_utils import load_fixture_data
 
 FIXTURE_ROOT = Path("tests/fixtures/samples")
 MALT_FIXTURE = FIXTURE_ROOT / "23244001000241"
-SPIRIT_FIXTURE = FIXTURE_ROOT / "18295001000454"
 CONTEXT_ROOT = Path("context")
 MALT_CONTEXT = CONTEXT_ROOT / "malt-beverage-class-types.txt"
 SPIRIT_CONTEXT = CONTEXT_ROOT / "spirits-class-types.txt"
 
-_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
-_SUPERSCRIPT_RE = re.compile(r"[\u00b9\u00b2\u00b3]+")
-_TERM_CLEAN_RE = re.compile(r"[^A-Z0-9]+")
+_TERM_CLEAN_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if not chr(code).isalnum()}
+)
+_OR_SPLIT_RE = re.compile(r"\s+OR\s+|/")
 _HEADING_EXCLUDE = {
     "CHAPTER 4",
     "CLASS AND TYPE DESIGNATION",
@@ -37,38 +36,19 @@ _HEADING_EXCLUDE = {
 }
 
 
-def _load_fixture_data(fixture_dir: Path) -> dict[str, object]:
-    return json.loads((fixture_dir / "data.json").read_text(encoding="utf-8"))
-
-
-def _open_images(fixture_dir: Path, data: dict[str, object]) -> list[Image.Image]:
-    images: list[Image.Image] = []
-    for name in data.get("images", []):
-        image_path = fixture_dir / "images" / name
-        if not image_path.exists():
-            warnings.warn(f"Missing image file: {image_path}", stacklevel=2)
-            continue
-        images.append(Image.open(image_path))
-    return images
-
-
-def _close_images(images: list[Image.Image]) -> None:
-    for image in images:
-        image.close()
-
-
-def _assert_fixture_type(fields: dict[str, object], expected: str) -> None:
+def _assert_fixture_type(fields: Mapping[str, object], expected: str) -> None:
     raw_types = fields.get("type_of_product", [])
     if not isinstance(raw_types, list):
         raise AssertionError("Fixture `type_of_product` must be a list.")
     assert expected in raw_types
 
 
+def _strip_non_ascii(text: str) -> str:
+    return text.encode("ascii", "ignore").decode("ascii")
+
+
 def _normalize_heading(text: str) -> str:
-    cleaned = _SUPERSCRIPT_RE.sub("", text)
-    cleaned = _NON_ASCII_RE.sub("", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    return " ".join(_strip_non_ascii(text).split())
 
 
 def _heading_from_line(line: str) -> str | None:
@@ -95,75 +75,74 @@ def _heading_from_line(line: str) -> str | None:
 
 
 def _normalize_term(value: str) -> str:
-    cleaned = _NON_ASCII_RE.sub("", value)
-    cleaned = _TERM_CLEAN_RE.sub(" ", cleaned.upper()).strip()
-    return re.sub(r"\s+", " ", cleaned)
+    cleaned = _strip_non_ascii(value).upper().translate(_TERM_CLEAN_TABLE)
+    return " ".join(cleaned.split())
 
 
-@lru_cache(maxsize=1)
-def _context_terms(path: Path) -> set[str]:
+@cache
+def _context_terms(path: Path) -> frozenset[str]:
     if not path.exists():
-        return set()
+        return frozenset()
     terms: set[str] = set()
-    for line in path.read_text(encoding="utf-8").splitlines():
-        heading = _heading_from_line(line.strip())
-        if not heading:
-            continue
-        for part in re.split(r"\s+OR\s+|/", heading):
-            normalized = _normalize_term(part.strip(" -"))
-            if normalized and normalized not in _HEADING_EXCLUDE:
-                terms.add(normalized)
-    return terms
-
-
-def _matches_allowed_term(value: str, allowed_terms: set[str]) -> bool:
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            heading = _heading_from_line(line.strip())
+            if not heading:
+                continue
+            for part in _OR_SPLIT_RE.split(heading):
+                normalized = _normalize_term(part.strip(" -"))
+                if normalized and normalized not in _HEADING_EXCLUDE:
+                    terms.add(normalized)
+    return frozenset(terms)
+
+
+@cache
+def _context_term_pattern(path: Path) -> re.Pattern[str]:
+    terms = sorted(_context_terms(path), key=len, reverse=True)
+    return re.compile(" (?:" + "|".join(map(re.escape, terms)) + ") ")
+
+
+def _matches_allowed_term(value: str, term_pattern: re.Pattern[str]) -> bool:
     normalized_value = _normalize_term(value)
     padded = f" {normalized_value} "
-    return any(f" {term} " in padded for term in allowed_terms)
+    return term_pattern.search(padded) is not None
 
 
-def _assert_class_type(value: str | None, allowed_terms: set[str]) -> None:
+def _assert_class_type(value: str | None, context_path: Path) -> None:
     assert value is not None
     assert value == value.strip()
     assert value[0].isalnum()
     assert value[-1].isalnum()
-    assert _matches_allowed_term(value, allowed_terms)
+    assert _matches_allowed_term(value, _context_term_pattern(context_path))
 
 
 def test_class_type_extraction_spirits_strips_punctuation(
+    crystal_springs_data,
     crystal_springs_extraction,
 ) -> None:
-    if not SPIRIT_FIXTURE.exists():
-        pytest.skip(f"Fixture directory missing: {SPIRIT_FIXTURE}")
-    data = _load_fixture_data(SPIRIT_FIXTURE)
-    fields = data.get("fields", {})
+    fields = crystal_springs_data.get("fields", {})
     if not isinstance(fields, dict):
         raise AssertionError("Fixture has invalid fields payload.")
     _assert_fixture_type(fields, "distilled_spirits")
 
     allowed_terms = _context_terms(SPIRIT_CONTEXT)
     assert allowed_terms, "No distilled spirits class/type terms loaded."
-    _assert_class_type(crystal_springs_extraction.class_type.value, allowed_terms)
+    _assert_class_type(crystal_springs_extraction.class_type.value, SPIRIT_CONTEXT)
 
 
-def test_class_type_extraction_malt_beverage() -> None:
+def test_class_type_extraction_malt_beverage(
+    cached_extraction: Callable[[Path], OcrExtractionResult],
+) -> None:
     if not MALT_FIXTURE.exists():
         pytest.skip(f"Fixture directory missing: {MALT_FIXTURE}")
-    data = _load_fixture_data(MALT_FIXTURE)
+    data = load_fixture_data(MALT_FIXTURE)
     fields = data.get("fields", {})
     if not isinstance(fields, dict):
         raise AssertionError("Fixture has invalid fields payload.")
     _assert_fixture_type(fields, "malt_beverage")
 
-    images = _open_images(MALT_FIXTURE, data)
-    if not images:
-        pytest.skip(f"Fixture {MALT_FIXTURE.name} has no readable images.")
-
-    try:
-        label_info = extract_label_info_from_application_images(images)
-    finally:
-        _close_images(images)
+    label_info = cached_extraction(MALT_FIXTURE).label_info
 
     allowed_terms = _context_terms(MALT_CONTEXT)
     assert allowed_terms, "No malt beverage class/type terms loaded."
-    _assert_class_type(label_info.class_type.value, allowed_terms)
+    _assert_class_type(label_info.class_type.value, MALT_CONTEXT)
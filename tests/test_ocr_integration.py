@@ -1,46 +1,24 @@
-import json
 import re
-import warnings
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from PIL import Image
 
-from cola_label_verification.ocr import extract_label_info_from_application_images
-
-FIXTURE_ROOTS = (Path("tests/fixtures/samples"),)
+from cola_label_verification.ocr import OcrExtractionResult
+from tests._fixture_utils import (
+    FIXTURE_DIRS,
+    FIXTURE_IDS,
+    FixtureIssueReporter,
+    load_fixture_data,
+)
 
-_ABV_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_ABV_RE = re.compile(r"(\d+(?:\.\d+)?)", re.ASCII)
 _NET_CONTENTS_RE = re.compile(
-    r"(\d+(?:\.\d+)?)\s*(milliliter|milliliters|ml|liter|liters|l|fl\.?\s*oz|oz)",
+    r"(\d+(?:\.\d+)?)\s*(?:(milliliters?|ml)|(liters?|l)|(fl\.?\s*oz|oz))",
     re.IGNORECASE,
 )
-
-
-def _iter_fixture_dirs() -> list[Path]:
-    fixture_dirs: list[Path] = []
-    for root in FIXTURE_ROOTS:
-        if not root.exists():
-            continue
-        for path in sorted(root.iterdir()):
-            if path.is_dir() and (path / "data.json").exists():
-                fixture_dirs.append(path)
-    return fixture_dirs
-
-
-def _load_fixture_data(fixture_dir: Path) -> dict[str, object]:
-    return json.loads((fixture_dir / "data.json").read_text(encoding="utf-8"))
-
-
-def _open_images(fixture_dir: Path, data: dict[str, object]) -> list[Image.Image]:
-    images: list[Image.Image] = []
-    for name in data.get("images", []):
-        image_path = fixture_dir / "images" / name
-        if not image_path.exists():
-            warnings.warn(f"Missing image file: {image_path}", stacklevel=2)
-            continue
-        images.append(Image.open(image_path))
-    return images
+# Millilitres per unit, indexed by the number of the unit group that matched.
+_UNIT_GROUP_TO_ML = (None, None, 1.0, 1000.0, 29.5735)
 
 
 def _parse_abv(value: str | None) -> float | None:
@@ -58,38 +36,32 @@ def _parse_net_contents(value: str | None) -> float | None:
     match = _NET_CONTENTS_RE.search(value)
     if not match:
         return None
-    amount = float(match.group(1))
-    unit = match.group(2).lower().replace(".", "").replace(" ", "")
-    if unit in {"ml", "milliliter", "milliliters"}:
-        return amount
-    if unit in {"l", "liter", "liters"}:
-        return amount * 1000
-    if unit in {"floz", "oz"}:
-        return amount * 29.5735
-    return None
-
-
-def _close_images(images: list[Image.Image]) -> None:
-    for image in images:
-        image.close()
+    return float(match.group(1)) * _UNIT_GROUP_TO_ML[match.lastindex]
 
 
-def _assert_close(actual: float, expected: float, *, tolerance: float) -> None:
-    assert abs(actual - expected) <= tolerance
+def _report_missing(
+    report_issue: FixtureIssueReporter,
+    fixture_dir: Path,
+    field_name: str,
+) -> None:
+    report_issue(fixture_dir, f"missing `{field_name}` for verification")
 
 
-def _warn_missing(fixture_dir: Path, field_name: str) -> None:
-    warnings.warn(
-        f"Fixture {fixture_dir.name} missing `{field_name}` for verification.",
-        stacklevel=2,
-    )
-
-
-FIXTURE_DIRS = _iter_fixture_dirs()
-
-
-def _fixture_id(fixture_dir: Path) -> str:
-    return f"{fixture_dir.parent.name}/{fixture_dir.name}"
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("750 mL", 750.0),
+        ("750\xa0mL", 750.0),
+        ("1.75 Liters", 1750.0),
+        ("12 FL. OZ.", 12 * 29.5735),
+        ("no amount", None),
+    ],
+)
+def test_parse_net_contents_converts_to_milliliters(
+    value: str,
+    expected: float | None,
+) -> None:
+    assert _parse_net_contents(value) == expected
 
 
 def test_fixtures_present() -> None:
@@ -99,54 +71,50 @@ def test_fixtures_present() -> None:
 @pytest.mark.parametrize(
     "fixture_dir",
     FIXTURE_DIRS,
-    ids=[_fixture_id(fixture_dir) for fixture_dir in FIXTURE_DIRS],
+    ids=FIXTURE_IDS,
 )
-def test_ocr_against_fixture(fixture_dir: Path) -> None:
-    data = _load_fixture_data(fixture_dir)
+def test_ocr_against_fixture(
+    fixture_dir: Path,
+    cached_extraction: Callable[[Path], OcrExtractionResult],
+    report_fixture_issue: FixtureIssueReporter,
+) -> None:
+    data = load_fixture_data(fixture_dir)
     fields = data.get("fields", {})
     if not isinstance(fields, dict):
         raise AssertionError(f"Fixture {fixture_dir} has invalid fields payload.")
 
-    images = _open_images(fixture_dir, data)
-    if not images:
-        warnings.warn(
-            f"Fixture {fixture_dir.name} has no readable images.",
-            stacklevel=2,
-        )
-        return
-
-    try:
-        label_info = extract_label_info_from_application_images(
-            images,
-        )
-    finally:
-        _close_images(images)
+    label_info = cached_extraction(fixture_dir).label_info
 
     expected_abv = _parse_abv(fields.get("alcohol_content"))
     expected_net = _parse_net_contents(fields.get("net_contents"))
     expected_warning = fields.get("warning_text")
 
     if expected_abv is None:
-        _warn_missing(fixture_dir, "alcohol_content")
+        _report_missing(report_fixture_issue, fixture_dir, "alcohol_content")
     else:
         extracted_abv = _parse_abv(label_info.alcohol_content.value)
         assert extracted_abv is not None, (
             f"{fixture_dir.name}: expected ABV {expected_abv}, got None"
         )
-        _assert_close(extracted_abv, expected_abv, tolerance=0.6)
+        assert abs(extracted_abv - expected_abv) <= 0.6, (
+            f"{fixture_dir.name}: expected ABV {expected_abv}, got {extracted_abv}"
+        )
 
     if expected_net is None:
-        _warn_missing(fixture_dir, "net_contents")
+        _report_missing(report_fixture_issue, fixture_dir, "net_contents")
     else:
         extracted_net = _parse_net_contents(label_info.net_contents.value)
         assert extracted_net is not None, (
             f"{fixture_dir.name}: expected net contents {expected_net}mL, got None"
         )
         tolerance = max(5.0, expected_net * 0.02)
-        _assert_close(extracted_net, expected_net, tolerance=tolerance)
+        assert abs(extracted_net - expected_net) <= tolerance, (
+            f"{fixture_dir.name}: expected net contents {expected_net}mL, "
+            f"got {extracted_net}mL"
+        )
 
     if expected_warning is None:
-        _warn_missing(fixture_dir, "warning_text")
+        _report_missing(report_fixture_issue, fixture_dir, "warning_text")
     else:
         extracted_warning = label_info.warning_text.value
         assert extracted_warning is not None, (
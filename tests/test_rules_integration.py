@@ -1,14 +1,13 @@
-import json
-import warnings
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Literal
 
 import pytest
-from PIL import Image
 
-from cola_label_verification.ocr import extract_label_info_with_spans
+from cola_label_verification.ocr import OcrExtractionResult
 from cola_label_verification.rules import ApplicationFields, evaluate_checklist
 from cola_label_verification.rules.models import FindingStatus
+from tests._fixture_utils import load_fixture_data
 
 FIXTURE_ROOT = Path("tests/fixtures/samples")
 STATUS_SET: set[FindingStatus] = {
@@ -20,28 +19,8 @@ STATUS_SET: set[FindingStatus] = {
 }
 
 
-def _load_fixture_data(fixture_dir: Path) -> dict[str, object]:
-    return json.loads((fixture_dir / "data.json").read_text(encoding="utf-8"))
-
-
-def _open_images(fixture_dir: Path, data: dict[str, object]) -> list[Image.Image]:
-    images: list[Image.Image] = []
-    for name in data.get("images", []):
-        image_path = fixture_dir / "images" / name
-        if not image_path.exists():
-            warnings.warn(f"Missing image file: {image_path}", stacklevel=2)
-            continue
-        images.append(Image.open(image_path))
-    return images
-
-
-def _close_images(images: list[Image.Image]) -> None:
-    for image in images:
-        image.close()
-
-
 def _beverage_type(
-    fields: dict[str, object],
+    fields: Mapping[str, object],
 ) -> Literal["distilled_spirits", "wine"] | None:
     types = fields.get("type_of_product", [])
     if isinstance(types, list):
@@ -52,7 +31,7 @@ def _beverage_type(
     return None
 
 
-def _application_fields(fields: dict[str, object]) -> ApplicationFields:
+def _application_fields(fields: Mapping[str, object]) -> ApplicationFields:
     source_of_product: tuple[str, ...] | None = None
     raw_source = fields.get("source_of_product")
     if isinstance(raw_source, list):
@@ -77,22 +56,18 @@ def _application_fields(fields: dict[str, object]) -> ApplicationFields:
         "14323001000602",  # distilled spirits
     ],
 )
-def test_rules_engine_integration(fixture_id: str) -> None:
+def test_rules_engine_integration(
+    fixture_id: str,
+    cached_extraction: Callable[[Path], OcrExtractionResult],
+) -> None:
     fixture_dir = FIXTURE_ROOT / fixture_id
-    data = _load_fixture_data(fixture_dir)
+    data = load_fixture_data(fixture_dir)
     fields = data.get("fields", {})
     if not isinstance(fields, dict):
         raise AssertionError(f"Fixture {fixture_id} has invalid fields payload.")
 
-    images = _open_images(fixture_dir, data)
-    if not images:
-        pytest.skip(f"Fixture {fixture_id} has no readable images.")
-
-    try:
-        extraction = extract_label_info_with_spans(images)
-        label_info = extraction.label_info
-    finally:
-        _close_images(images)
+    extraction = cached_extraction(fixture_dir)
+    label_info = extraction.label_info
 
     result = evaluate_checklist(
         label_info,
@@ -102,9 +77,9 @@ def test_rules_engine_integration(fixture_id: str) -> None:
 
     assert result.findings, "Checklist produced no findings."
     assert all(finding.status in STATUS_SET for finding in result.findings)
-    assert any(f.rule_id == "warning_text" for f in result.findings)
+    assert "warning_text" in result.findings_by_id
     if _beverage_type(fields) == "wine":
-        assert any(f.rule_id == "grape_varietals" for f in result.findings)
+        assert "grape_varietals" in result.findings_by_id
 
 
 def test_warning_text_boldness_thresholds_todo() -> None:
@@ -6,8 +6,12 @@ from PIL import Image
 
 from cola_label_verification import vlm
 
+_EXPECTED_QWEN_FIELDS = frozenset(vlm._QWEN_FIELDS) - {"beverage_type"}
+
 
 class DummyTensor:
+    __slots__ = ("device",)
+
     def __init__(self) -> None:
         self.device = None
 
@@ -17,6 +21,8 @@ class DummyTensor:
 
 
 class DummyProcessor:
+    __slots__ = ("decoded", "chat_template_args", "call_args")
+
     def __init__(self, decoded: list[str]) -> None:
         self.decoded = decoded
         self.chat_template_args: dict[str, object] | None = None
@@ -59,10 +65,12 @@ class DummyProcessor:
         *,
         skip_special_tokens: bool,
     ) -> list[str]:
-        return list(self.decoded)
+        return self.decoded
 
 
 class DummyModel:
+    __slots__ = ("device", "generate_args")
+
     def __init__(self) -> None:
         self.device = "cpu"
         self.generate_args: dict[str, object] | None = None
@@ -73,6 +81,8 @@ class DummyModel:
 
 
 class DummyImageProcessor:
+    __slots__ = ("source", "local_files_only", "trust_remote_code")
+
     def __init__(
         self,
         source: str,
@@ -95,6 +105,13 @@ class DummyImageProcessor:
 
 
 class DummyTokenizer:
+    __slots__ = (
+        "source",
+        "local_files_only",
+        "trust_remote_code",
+        "chat_template",
+    )
+
     def __init__(
         self,
         source: str,
@@ -118,6 +135,13 @@ class DummyTokenizer:
 
 
 class DummyVLProcessor:
+    __slots__ = (
+        "image_processor",
+        "tokenizer",
+        "video_processor",
+        "chat_template",
+    )
+
     def __init__(
         self,
         *,
@@ -380,8 +404,7 @@ def test_extract_qwen_field_values_parses_payload(
     assert result.fields["net_contents"].numeric_value == 750.0
     assert result.fields["percentage_of_foreign_wine"].numeric_value == 1.25
     assert result.fields["warning_text"] is None
-    expected_fields = set(vlm._QWEN_FIELDS) - {"beverage_type"}
-    assert set(result.fields.keys()) == expected_fields
+    assert result.fields.keys() == _EXPECTED_QWEN_FIELDS
     assert processor.chat_template_args == {
         "messages": processor.chat_template_args["messages"],
         "tokenize": False,